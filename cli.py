@@ -1,19 +1,66 @@
 import os
 import sys
+import functools
 import time
-import configparser
+import json
+import hashlib
 import argparse
 from datetime import timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from youtube_transcript_api import YouTubeTranscriptApi
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
+from googleapiclient.model import JsonModel
+from youtube_transcript_api._errors import (
+    CouldNotRetrieveTranscript,
+    NoTranscriptFound,
+    TranscriptsDisabled,
+)
 from rich.table import Column
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 
-MAX_WORKERS = 10
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+DEFAULT_MAX_WORKERS = 32
+
+
+def _get_max_workers_from_env():
+    value = os.environ.get("CAPSCRIPT_WORKERS")
+    if value is None:
+        return DEFAULT_MAX_WORKERS
+    try:
+        workers = int(value)
+        if workers > 0:
+            return workers
+    except ValueError:
+        pass
+    print(
+        f"Warning: Ignoring invalid CAPSCRIPT_WORKERS value '{value}', using {DEFAULT_MAX_WORKERS}."
+    )
+    return DEFAULT_MAX_WORKERS
+
+
+MAX_WORKERS = _get_max_workers_from_env()
+FORMAT_TIME_CACHE_SIZE = 8192
 DEFAULT_OUTPUT_DIR = "transcripts"
+VIDEOS_LIST_BATCH_SIZE = 50
+API_NUM_RETRIES = 5
+PROGRESS_UPDATE_BATCH = 8
+PROGRESS_UPDATE_INTERVAL = 0.1
+OUTPUT_BUFFER_SIZE = 1 << 20
+VIDEO_DETAILS_SEPARATOR = "\n\n══════════════════════════════════════════════\n\n"
+UNKNOWN_VIDEO_DETAILS = (
+    "Unknown Title",
+    "Unknown Channel",
+    "Unknown Channel ID",
+    "Unknown Date",
+    0,
+)
 
 
 def _get_application_root_path():
@@ -23,16 +70,23 @@ def _get_application_root_path():
         return os.path.dirname(os.path.abspath(__file__))
 
 
-PREFERENCES_FILE_PATH = os.path.join(_get_application_root_path(), "preferences.ini")
-_PREFERENCES_SECTION = "Preferences"
-_API_KEY_OPTION = "API_KEY"
+PREFERENCES_FILE_PATH = os.path.join(_get_application_root_path(), "preferences.json")
+_LEGACY_PREFERENCES_FILE_PATH = os.path.join(
+    _get_application_root_path(), "preferences.ini"
+)
+_API_KEY_OPTION = "api_key"
+_API_KEY_HASH_OPTION = "api_key_sha256"
+_API_KEY_VALIDATED_AT_OPTION = "api_key_validated_at"
+API_KEY_VALIDATION_TTL = 24 * 60 * 60
+API_KEY_PROBE_VIDEO_ID = "dQw4w9WgXcQ"
 
 
-def is_valid_api_key(api_key):
+def is_valid_api_key(api_key, youtube=None):
     print(f"Attempting to validate API key: {api_key[:4]}...{api_key[-4:]}")
     try:
-        youtube = build("youtube", "v3", developerKey=api_key)
-        youtube.search().list(part="id", maxResults=1, q="test").execute()
+        if youtube is None:
+            youtube = get_authenticated_service(api_key)
+        youtube.videos().list(part="id", id=API_KEY_PROBE_VIDEO_ID).execute()
         print("API key validation successful.")
         return True
     except HttpError as e:
@@ -43,58 +97,83 @@ def is_valid_api_key(api_key):
         return False
 
 
+class _FastJsonModel(JsonModel):
+    def deserialize(self, content):
+        try:
+            body = _json_loads(content)
+        except ValueError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
 def get_authenticated_service(api_key):
-    return build("youtube", "v3", developerKey=api_key)
+    return build(
+        "youtube",
+        "v3",
+        developerKey=api_key,
+        cache_discovery=False,
+        model=_FastJsonModel(),
+    )
 
 
-def has_captions(video_id, language_code):
+def find_caption_transcript(video_id, language_code):
     try:
         transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        transcript = transcript_list.find_transcript([language_code])
-        return True
-    except (NoTranscriptFound, TranscriptsDisabled):
-        return False
-    except Exception:
-        return False
+        return transcript_list.find_transcript([language_code])
+    except CouldNotRetrieveTranscript:
+        return None
 
 
-def get_video_details(youtube, video_id):
-    response = (
-        youtube.videos()
-        .list(
-            part="snippet,statistics",
-            id=video_id,
+def has_captions(video_id, language_code):
+    return find_caption_transcript(video_id, language_code) is not None
+
+
+def get_videos_details(youtube, video_ids):
+    details = {}
+    for start in range(0, len(video_ids), VIDEOS_LIST_BATCH_SIZE):
+        chunk = video_ids[start : start + VIDEOS_LIST_BATCH_SIZE]
+        response = (
+            youtube.videos()
+            .list(
+                part="snippet,statistics",
+                id=",".join(chunk),
+            )
+            .execute(num_retries=API_NUM_RETRIES)
         )
-        .execute()
-    )
 
-    if not response.get("items"):
-        print(f"Warning: No items found for video_id {video_id} in get_video_details")
-        return (
-            "Unknown Title",
-            "Unknown Channel",
-            "Unknown Channel ID",
-            "Unknown Date",
-            0,
-        )
+        for item in response.get("items", []):
+            video_info = item.get("snippet", {})
+            video_statistics = item.get("statistics", {})
+            details[item["id"]] = (
+                video_info.get("title", "Unknown Title"),
+                video_info.get("channelTitle", "Unknown Channel"),
+                video_info.get("channelId", "Unknown Channel ID"),
+                video_info.get("publishedAt", "Unknown Date"),
+                int(video_statistics.get("viewCount", 0)),
+            )
 
-    video_info = response["items"][0]["snippet"]
-    video_statistics = response["items"][0].get("statistics", {})
-    title = video_info.get("title", "Unknown Title")
-    channel_title = video_info.get("channelTitle", "Unknown Channel")
-    channel_id = video_info.get("channelId", "Unknown Channel ID")
-    date_uploaded = video_info.get("publishedAt", "Unknown Date")
-    views = int(video_statistics.get("viewCount", 0))
+    return details
 
-    return title, channel_title, channel_id, date_uploaded, views
+
+def get_video_details(youtube, video_id):
+    details = get_videos_details(youtube, [video_id])
+    if video_id not in details:
+        print(f"Warning: No items found for video_id {video_id} in get_video_details")
+        return UNKNOWN_VIDEO_DETAILS
+    return details[video_id]
 
 
 def format_views(views):
     return "{:,}".format(views)
 
 
-def save_preferences(api_key):
-    config = configparser.ConfigParser()
+def _hash_api_key(api_key):
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _write_preferences(preferences):
     if not os.path.exists(os.path.dirname(PREFERENCES_FILE_PATH)):
         try:
             os.makedirs(os.path.dirname(PREFERENCES_FILE_PATH), exist_ok=True)
@@ -102,33 +181,89 @@ def save_preferences(api_key):
             print(f"Error creating directory for preferences: {e}")
             return False
 
-    config[_PREFERENCES_SECTION] = {_API_KEY_OPTION: api_key}
     try:
-        with open(PREFERENCES_FILE_PATH, "w", encoding="utf-8") as configfile:
-            config.write(configfile)
+        with open(PREFERENCES_FILE_PATH, "w", encoding="utf-8") as prefs_file:
+            json.dump(preferences, prefs_file)
         return True
     except IOError as e:
         print(f"Error writing preferences file '{PREFERENCES_FILE_PATH}': {e}")
         return False
 
 
-def load_preferences():
+def _validation_record(api_key):
+    return {
+        _API_KEY_HASH_OPTION: _hash_api_key(api_key),
+        _API_KEY_VALIDATED_AT_OPTION: time.time(),
+    }
+
+
+def save_preferences(api_key, validated=False):
+    preferences = {_API_KEY_OPTION: api_key}
+    if validated:
+        preferences.update(_validation_record(api_key))
+    return _write_preferences(preferences)
+
+
+def record_validation(api_key):
+    preferences = _read_preferences()
+    if preferences.get(_API_KEY_OPTION) != api_key:
+        return False
+    preferences.update(_validation_record(api_key))
+    return _write_preferences(preferences)
+
+
+def _load_legacy_preferences():
+    import configparser
+
     config = configparser.ConfigParser()
-    if not os.path.exists(PREFERENCES_FILE_PATH):
-        return ""
     try:
-        config.read(PREFERENCES_FILE_PATH, encoding="utf-8")
-        api_key = config.get(_PREFERENCES_SECTION, _API_KEY_OPTION, fallback="")
-        return api_key
+        config.read(_LEGACY_PREFERENCES_FILE_PATH, encoding="utf-8")
+        return config.get("Preferences", "API_KEY", fallback="")
     except (configparser.Error, IOError) as e:
-        print(f"Error reading preferences file '{PREFERENCES_FILE_PATH}': {e}")
+        print(f"Error reading preferences file '{_LEGACY_PREFERENCES_FILE_PATH}': {e}")
         return ""
 
 
+def _read_preferences():
+    if not os.path.exists(PREFERENCES_FILE_PATH):
+        if os.path.exists(_LEGACY_PREFERENCES_FILE_PATH):
+            return {_API_KEY_OPTION: _load_legacy_preferences()}
+        return {}
+    try:
+        with open(PREFERENCES_FILE_PATH, "r", encoding="utf-8") as prefs_file:
+            preferences = json.load(prefs_file)
+        if not isinstance(preferences, dict):
+            raise ValueError("expected a JSON object")
+        return preferences
+    except (ValueError, IOError) as e:
+        print(f"Error reading preferences file '{PREFERENCES_FILE_PATH}': {e}")
+        return {}
+
+
+def load_preferences():
+    api_key = _read_preferences().get(_API_KEY_OPTION, "")
+    return api_key if isinstance(api_key, str) else ""
+
+
+def is_recently_validated(api_key):
+    preferences = _read_preferences()
+    if preferences.get(_API_KEY_HASH_OPTION) != _hash_api_key(api_key):
+        return False
+    validated_at = preferences.get(_API_KEY_VALIDATED_AT_OPTION)
+    if not isinstance(validated_at, (int, float)):
+        return False
+    return 0 <= time.time() - validated_at < API_KEY_VALIDATION_TTL
+
+
 def format_time(seconds):
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=FORMAT_TIME_CACHE_SIZE)
+def _format_whole_seconds(seconds):
     hours, remainder = divmod(seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
-    return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def parse_video_ids(video_ids_input):
@@ -158,8 +293,16 @@ def parse_video_ids(video_ids_input):
     return None
 
 
-def get_channel_videos(youtube, channel_id, language_code="en", max_results=10):
+def get_channel_videos(
+    youtube,
+    channel_id,
+    language_code="en",
+    max_results=10,
+    transcripts=None,
+    max_workers=MAX_WORKERS,
+):
     video_ids = []
+    seen = set()
     nextPageToken = None
     fetched_count = 0
 
@@ -180,7 +323,7 @@ def get_channel_videos(youtube, channel_id, language_code="en", max_results=10):
                     order="date",
                     pageToken=nextPageToken,
                 )
-                .execute()
+                .execute(num_retries=API_NUM_RETRIES)
             )
 
             items = response.get("items", [])
@@ -188,18 +331,41 @@ def get_channel_videos(youtube, channel_id, language_code="en", max_results=10):
                 print("No more videos found for the channel.")
                 break
 
+            candidates = []
             for item in items:
                 if "videoId" in item["id"]:
                     video_id = item["id"]["videoId"]
-                    if video_id not in video_ids:
-                        if has_captions(video_id, language_code):
-                            video_ids.append(video_id)
-                            fetched_count += 1
-                            print(
-                                f"Found video with captions: {video_id} ({fetched_count}/{max_results})"
-                            )
-                            if fetched_count >= max_results:
-                                break
+                    if video_id not in seen:
+                        seen.add(video_id)
+                        candidates.append(video_id)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                caption_checks = [
+                    (
+                        video_id,
+                        executor.submit(
+                            find_caption_transcript, video_id, language_code
+                        ),
+                    )
+                    for video_id in candidates
+                ]
+                for video_id, future in caption_checks:
+                    try:
+                        transcript = future.result()
+                    except Exception as e:
+                        print(f"Error checking captions for {video_id}: {e}")
+                        continue
+                    if transcript is not None:
+                        if transcripts is not None:
+                            transcripts[video_id] = transcript
+                        video_ids.append(video_id)
+                        fetched_count += 1
+                        print(
+                            f"Found video with captions: {video_id} ({fetched_count}/{max_results})"
+                        )
+                        if fetched_count >= max_results:
+                            executor.shutdown(cancel_futures=True)
+                            break
 
             if fetched_count >= max_results:
                 break
@@ -224,15 +390,12 @@ def get_channel_videos(youtube, channel_id, language_code="en", max_results=10):
     return video_ids[:max_results]
 
 
-def fetch_transcript(video_id, language_code, target_word):
+def download_transcript(video_id, language_code, transcript=None):
     try:
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        transcript_obj = transcript_list.find_transcript([language_code])
-        transcript = transcript_obj.fetch()
-        transcript_items = [
-            item for item in transcript if target_word.lower() in item["text"].lower()
-        ]
-        return transcript_items
+        if transcript is None:
+            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+            transcript = transcript_list.find_transcript([language_code])
+        return transcript.fetch().to_raw_data()
     except (NoTranscriptFound, TranscriptsDisabled):
         return []
     except Exception as e:
@@ -240,6 +403,58 @@ def fetch_transcript(video_id, language_code, target_word):
         return []
 
 
+def filter_transcript(transcript, target_word, max_matches_per_video=None):
+    needle = target_word.casefold()
+    transcript_items = []
+    for item in transcript:
+        if needle in item["text"].casefold():
+            transcript_items.append(item)
+            if len(transcript_items) == max_matches_per_video:
+                break
+    return transcript_items
+
+
+def build_video_details_text(youtube, video_ids, transcript_items_by_id):
+    try:
+        video_details_by_id = get_videos_details(youtube, video_ids)
+    except Exception as e:
+        print(f"\nError fetching video details: {e}")
+        video_details_by_id = {}
+
+    video_details_text = []
+    for video_id in video_ids:
+        (
+            title,
+            channel_title,
+            channel_id_vid,
+            date_uploaded,
+            views,
+        ) = video_details_by_id.get(video_id, UNKNOWN_VIDEO_DETAILS)
+        lines = [
+            f"Video Title: {title}",
+            f"Video ID: {video_id}",
+            f"Channel Name: {channel_title}",
+            f"Channel ID: {channel_id_vid}",
+            f"Date Uploaded: {date_uploaded}",
+            f"Views: {format_views(views)}",
+            "Timestamps:",
+        ]
+        lines.extend(
+            f"╳ {format_time(item['start'])} - {item['text']}"
+            for item in transcript_items_by_id[video_id]
+        )
+        video_text = "\n".join(lines) + VIDEO_DETAILS_SEPARATOR
+        video_details_text.append(video_text)
+    return video_details_text
+
+
+def _remove_file_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Search YouTube video captions for specific keywords."
@@ -251,7 +466,7 @@ def main():
     parser.add_argument(
         "--save-api-key",
         action="store_true",
-        help="Save the provided API key to preferences.ini.",
+        help="Save the provided API key to preferences.json.",
     )
 
     parser.add_argument(
@@ -280,6 +495,19 @@ def main():
         help=f"Directory to save transcript results (default: {DEFAULT_OUTPUT_DIR}).",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Number of concurrent transcript downloads (default: {MAX_WORKERS}, or CAPSCRIPT_WORKERS).",
+    )
+
+    parser.add_argument(
+        "--max-matches-per-video",
+        type=int,
+        help="Stop scanning a video's captions after this many matches (default: no limit).",
+    )
+
     parser.add_argument(
         "--channel-id",
         type=str,
@@ -300,35 +528,31 @@ def main():
 
     args = parser.parse_args()
 
+    if args.search_type == "channel":
+        if not args.channel_id:
+            parser.error("--channel-id is required when --search-type is 'channel'")
+        if args.max_results <= 0:
+            parser.error("--max-results must be a positive integer.")
+    elif args.search_type == "video":
+        if not args.video_ids:
+            parser.error("--video-ids is required when --search-type is 'video'")
+    if args.workers <= 0:
+        parser.error("--workers must be a positive integer.")
+    if args.max_matches_per_video is not None and args.max_matches_per_video <= 0:
+        parser.error("--max-matches-per-video must be a positive integer.")
+
     API_KEY = args.api_key
     if not API_KEY:
         API_KEY = load_preferences()
         if not API_KEY:
             print(
-                "Error: YouTube Data API key not found. Please provide one using --api-key or ensure it's in preferences.ini."
+                "Error: YouTube Data API key not found. Please provide one using --api-key or ensure it's in preferences.json."
             )
             sys.exit(1)
         else:
             print(f"Using API key from {PREFERENCES_FILE_PATH}.")
     else:
         print("Using API key provided via argument.")
-        if not is_valid_api_key(API_KEY):
-            print("Error: The provided API key is invalid.")
-            sys.exit(1)
-        if args.save_api_key:
-            if save_preferences(API_KEY):
-                print(f"API key saved to {PREFERENCES_FILE_PATH}.")
-            else:
-                print(f"Failed to save API key to {PREFERENCES_FILE_PATH}.")
-
-    if args.search_type == "channel":
-        if not args.channel_id:
-            parser.error("--channel-id is required when --search-type is 'channel'")
-        if args.max_results <= 0:
-            parser.error("--max-results must be a positive integer.")
-    elif args.search_type == "video":
-        if not args.video_ids:
-            parser.error("--video-ids is required when --search-type is 'video'")
 
     try:
         youtube = get_authenticated_service(API_KEY)
@@ -336,10 +560,30 @@ def main():
         print(f"Error initializing YouTube service: {e}")
         sys.exit(1)
 
+    if args.api_key:
+        if is_recently_validated(API_KEY):
+            print(f"API key already validated and saved in {PREFERENCES_FILE_PATH}.")
+        elif not is_valid_api_key(API_KEY, youtube):
+            print("Error: The provided API key is invalid.")
+            sys.exit(1)
+        elif args.save_api_key:
+            if save_preferences(API_KEY, validated=True):
+                print(f"API key saved to {PREFERENCES_FILE_PATH}.")
+            else:
+                print(f"Failed to save API key to {PREFERENCES_FILE_PATH}.")
+        else:
+            record_validation(API_KEY)
+
     video_ids_to_search = []
+    channel_transcripts = {}
     if args.search_type == "channel":
         video_ids_to_search = get_channel_videos(
-            youtube, args.channel_id, args.language, args.max_results
+            youtube,
+            args.channel_id,
+            args.language,
+            args.max_results,
+            transcripts=channel_transcripts,
+            max_workers=args.workers,
         )
         if not video_ids_to_search:
             print("No suitable videos found for the channel to search.")
@@ -359,87 +603,122 @@ def main():
         f"Searching for '{target_word}' in {len(video_ids_to_search)} video(s) using language '{language_code}'..."
     )
 
-    all_video_details_text = []
+    safe_keyword = (
+        "".join(c if c.isalnum() or c in (" ", "_", "-") else "_" for c in target_word)
+        .rstrip()
+        .replace(" ", "_")
+    )
+    output_file_name = f"{safe_keyword}_matches.txt"
+    output_file_path = os.path.join(output_dir, output_file_name)
+    partial_output_file_path = output_file_path + ".part"
+    try:
+        output_file = open(
+            partial_output_file_path,
+            "w",
+            encoding="utf-8",
+            buffering=OUTPUT_BUFFER_SIZE,
+        )
+    except OSError as e:
+        print(f"Error opening output file '{partial_output_file_path}': {e}")
+        sys.exit(1)
+
+    pending_video_ids = []
+    pending_transcript_items = {}
     match_count = 0
+    pending_advance = 0
+    last_progress_update = time.monotonic()
 
-    with Progress(
-        TextColumn("[yellow]Searching...", justify="left"),
-        BarColumn(bar_width=30),
-        TextColumn(
-            "[yellow4][progress.percentage]{task.percentage:>3.0f}%[/yellow4]",
-            justify="right",
-        ),
-        TimeRemainingColumn(),
-        TextColumn("Matches: [green]{task.fields[match_count]}"),
-        expand=True,
-    ) as progress_bar:
-        search_task = progress_bar.add_task(
-            "Videos", total=len(video_ids_to_search), match_count=0
-        )
+    try:
+        with output_file, Progress(
+            TextColumn("[yellow]Searching...", justify="left"),
+            BarColumn(bar_width=30),
+            TextColumn(
+                "[yellow4][progress.percentage]{task.percentage:>3.0f}%[/yellow4]",
+                justify="right",
+            ),
+            TimeRemainingColumn(),
+            TextColumn("Matches: [green]{task.fields[match_count]}"),
+            expand=True,
+        ) as progress_bar:
+            search_task = progress_bar.add_task(
+                "Videos", total=len(video_ids_to_search), match_count=0
+            )
+
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                future_to_video_id = {
+                    executor.submit(
+                        download_transcript,
+                        video_id,
+                        language_code,
+                        channel_transcripts.get(video_id),
+                    ): video_id
+                    for video_id in video_ids_to_search
+                }
+                for future in as_completed(future_to_video_id):
+                    video_id = future_to_video_id[future]
+                    try:
+                        transcript_items = filter_transcript(
+                            future.result(), target_word, args.max_matches_per_video
+                        )
+                        if transcript_items:
+                            match_count += len(transcript_items)
+                            pending_video_ids.append(video_id)
+                            pending_transcript_items[video_id] = transcript_items
+                    except Exception as e:
+                        print(f"\nError processing video ID {video_id}: {e}")
+
+                    pending_advance += 1
+                    now = time.monotonic()
+                    if (
+                        pending_advance >= PROGRESS_UPDATE_BATCH
+                        or now - last_progress_update >= PROGRESS_UPDATE_INTERVAL
+                    ):
+                        progress_bar.update(
+                            search_task, advance=pending_advance, match_count=match_count
+                        )
+                        pending_advance = 0
+                        last_progress_update = now
 
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            future_to_video_id = {
-                executor.submit(
-                    fetch_transcript, video_id, language_code, target_word
-                ): video_id
-                for video_id in video_ids_to_search
-            }
-            for future in as_completed(future_to_video_id):
-                video_id = future_to_video_id[future]
-                try:
-                    transcript_items = future.result()
-                    if transcript_items:
-                        current_matches = len(transcript_items)
-                        match_count += current_matches
-                        (
-                            title,
-                            channel_title,
-                            channel_id_vid,
-                            date_uploaded,
-                            views,
-                        ) = get_video_details(youtube, video_id)
-                        video_text = f"Video Title: {title}\n"
-                        video_text += f"Video ID: {video_id}\n"
-                        video_text += f"Channel Name: {channel_title}\n"
-                        video_text += f"Channel ID: {channel_id_vid}\n"
-                        video_text += f"Date Uploaded: {date_uploaded}\n"
-                        video_text += f"Views: {format_views(views)}\n"
-                        video_text += "Timestamps:\n"
-                        for item in transcript_items:
-                            time_str = format_time(item["start"])
-                            video_text += f"╳ {time_str} - {item['text']}\n"
-                        video_text += (
-                            "\n══════════════════════════════════════════════\n\n"
+                    if len(pending_video_ids) >= VIDEOS_LIST_BATCH_SIZE:
+                        output_file.writelines(
+                            build_video_details_text(
+                                youtube, pending_video_ids, pending_transcript_items
+                            )
                         )
-                        all_video_details_text.append(video_text)
-                    progress_bar.update(search_task, advance=1, match_count=match_count)
-                except Exception as e:
-                    print(f"\nError processing video ID {video_id}: {e}")
-                    progress_bar.update(search_task, advance=1)
+                        output_file.flush()
+                        pending_video_ids = []
+                        pending_transcript_items = {}
+
+            if pending_advance:
+                progress_bar.update(
+                    search_task, advance=pending_advance, match_count=match_count
+                )
+
+            if pending_video_ids:
+                output_file.writelines(
+                    build_video_details_text(
+                        youtube, pending_video_ids, pending_transcript_items
+                    )
+                )
+            output_file.flush()
+    except BaseException:
+        _remove_file_quietly(partial_output_file_path)
+        raise
 
     print(f"\n\nSearch finished!")
     if match_count > 0:
         print(
             f"Found a total of {match_count} match{'es' if match_count != 1 else ''} in the captions."
         )
-
-        safe_keyword = (
-            "".join(
-                c if c.isalnum() or c in (" ", "_", "-") else "_" for c in target_word
-            )
-            .rstrip()
-            .replace(" ", "_")
-        )
-        output_file_name = f"{safe_keyword}_matches.txt"
-        output_file_path = os.path.join(output_dir, output_file_name)
         try:
-            with open(output_file_path, "w", encoding="utf-8") as output_file:
-                output_file.writelines(all_video_details_text)
+            os.replace(partial_output_file_path, output_file_path)
             print(f"Generated .txt file at: {output_file_path}")
-        except Exception as e:
+        except OSError as e:
             print(f"\nError writing output file: {e}")
+            _remove_file_quietly(partial_output_file_path)
     else:
         print(f"No matches found for the keyword '{target_word}'.")
+        _remove_file_quietly(partial_output_file_path)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
 import sys
 import os
-import configparser
 import re
 import html
 from PySide6.QtWidgets import (
@@ -29,6 +28,7 @@ from PySide6.QtGui import (
     QDropEvent,
 )
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from cli import load_preferences, PREFERENCES_FILE_PATH
 
 
 try:
@@ -41,26 +41,15 @@ except ImportError:
     )
 
 
-PREFERENCES_FILE = "preferences.ini"
+PREFERENCES_FILE = PREFERENCES_FILE_PATH
 API_KEY = None
 YOUTUBE_SERVICE = None
 
 
 def load_api_key():
     global API_KEY
-    config = configparser.ConfigParser()
-    if not os.path.exists(PREFERENCES_FILE):
-        return False
-    try:
-        config.read(PREFERENCES_FILE)
-        API_KEY = config.get("Preferences", "API_KEY", fallback=None)
-        if API_KEY:
-            return True
-        else:
-            return False
-    except Exception as e:
-        print(f"Error loading preferences: {e}")
-        return False
+    API_KEY = load_preferences() or None
+    return bool(API_KEY)
 
 
 def initialize_youtube_service():
@@ -61,7 +61,12 @@ from PySide6.QtCore import (
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEngineSettings
 
-from cli import is_valid_api_key, save_preferences, load_preferences
+from cli import (
+    is_valid_api_key,
+    is_recently_validated,
+    save_preferences,
+    load_preferences,
+)
 
 from gui_utils import (
     format_log,
@@ -1722,11 +1727,17 @@ class MainWindow(QMainWindow):
                 color=self.GUI_COLOR_WARNING,
             )
 
+        if is_recently_validated(key):
+            self.log_gui_event(
+                "API key already validated and saved.", color=self.GUI_COLOR_SUCCESS
+            )
+            return
+
         self.log_gui_event("Validating API key...", color=self.GUI_COLOR_MUTED)
 
         try:
             if is_valid_api_key(key):
-                save_preferences(key)
+                save_preferences(key, validated=True)
                 self.log_gui_event(
                     "API key validated and saved successfully.",
                     color=self.GUI_COLOR_SUCCESS,